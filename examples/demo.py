@@ -11,36 +11,60 @@ Run with: python examples/demo.py
 
 import sys
 import os
-import subprocess
+import asyncio
 import tempfile
 import shutil
+from contextvars import ContextVar
+
+# Per-test output buffer, so tests running concurrently don't interleave
+_output = ContextVar("_output", default=None)
+
+
+def emit(text=""):
+    """Print a line, or buffer it if running inside a test."""
+    buffer = _output.get()
+    if buffer is None:
+        print(text)
+    else:
+        buffer.append(text)
 
 
 def print_header(text):
     """Print a formatted header."""
-    print()
-    print("=" * 60)
-    print(f"  {text}")
-    print("=" * 60)
-    print()
+    emit()
+    emit("=" * 60)
+    emit(f"  {text}")
+    emit("=" * 60)
+    emit()
 
 
 def print_success(text):
     """Print success message."""
-    print(f"✅ {text}")
+    emit(f"✅ {text}")
 
 
 def print_error(text):
     """Print error message."""
-    print(f"❌ {text}")
+    emit(f"❌ {text}")
 
 
 def print_info(text):
     """Print info message."""
-    print(f"ℹ️  {text}")
+    emit(f"ℹ️  {text}")
 
 
-def test_python_info():
+async def run_command(*args):
+    """Run a command without blocking the event loop; return (returncode, stdout, stderr)."""
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await proc.communicate()
+    return proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+
+async def test_python_info():
     """Display Python installation information."""
     print_header("Python Installation Info")
     
@@ -59,28 +83,24 @@ def test_python_info():
     return True
 
 
-def test_pip():
+async def test_pip():
     """Test pip availability."""
     print_header("Testing pip")
     
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "--version"],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
-            print_success(f"pip available: {result.stdout.strip()}")
+        returncode, stdout, stderr = await run_command(sys.executable, "-m", "pip", "--version")
+        if returncode == 0:
+            print_success(f"pip available: {stdout.strip()}")
             return True
         else:
-            print_error(f"pip failed: {result.stderr}")
+            print_error(f"pip failed: {stderr}")
             return False
     except Exception as e:
         print_error(f"pip test failed: {e}")
         return False
 
 
-def test_package_installation():
+async def test_package_installation():
     """Test installing a package."""
     print_header("Testing Package Installation")
     
@@ -91,28 +111,24 @@ def test_package_installation():
     
     try:
         # Install
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "install", "--quiet", test_package],
-            capture_output=True,
-            text=True
+        returncode, _, stderr = await run_command(
+            sys.executable, "-m", "pip", "install", "--quiet", test_package
         )
         
-        if result.returncode != 0:
-            print_error(f"Installation failed: {result.stderr}")
+        if returncode != 0:
+            print_error(f"Installation failed: {stderr}")
             return False
         
         # Verify import
-        result = subprocess.run(
-            [sys.executable, "-c", f"import {test_package}; print({test_package}.__version__)"],
-            capture_output=True,
-            text=True
+        returncode, stdout, stderr = await run_command(
+            sys.executable, "-c", f"import {test_package}; print({test_package}.__version__)"
         )
         
-        if result.returncode == 0:
-            print_success(f"Package '{test_package}' installed and importable (version: {result.stdout.strip()})")
+        if returncode == 0:
+            print_success(f"Package '{test_package}' installed and importable (version: {stdout.strip()})")
             return True
         else:
-            print_error(f"Import failed: {result.stderr}")
+            print_error(f"Import failed: {stderr}")
             return False
             
     except Exception as e:
@@ -120,7 +136,7 @@ def test_package_installation():
         return False
 
 
-def test_venv():
+async def test_venv():
     """Test virtual environment creation."""
     print_header("Testing Virtual Environment")
     
@@ -132,14 +148,10 @@ def test_venv():
         print_info(f"Creating virtual environment at: {venv_path}")
         
         # Create venv
-        result = subprocess.run(
-            [sys.executable, "-m", "venv", venv_path],
-            capture_output=True,
-            text=True
-        )
+        returncode, _, stderr = await run_command(sys.executable, "-m", "venv", venv_path)
         
-        if result.returncode != 0:
-            print_error(f"venv creation failed: {result.stderr}")
+        if returncode != 0:
+            print_error(f"venv creation failed: {stderr}")
             return False
         
         # Check venv structure
@@ -153,16 +165,12 @@ def test_venv():
             print_success(f"venv Python: {venv_python}")
             
             # Test venv Python
-            result = subprocess.run(
-                [venv_python, "--version"],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                print_success(f"venv Python works: {result.stdout.strip()}")
+            returncode, stdout, stderr = await run_command(venv_python, "--version")
+            if returncode == 0:
+                print_success(f"venv Python works: {stdout.strip()}")
                 return True
             else:
-                print_error(f"venv Python test failed: {result.stderr}")
+                print_error(f"venv Python test failed: {stderr}")
                 return False
         else:
             print_error(f"venv Python not found at expected location")
@@ -180,7 +188,7 @@ def test_venv():
             pass
 
 
-def test_standard_library():
+async def test_standard_library():
     """Test standard library imports."""
     print_header("Testing Standard Library")
     
@@ -194,18 +202,62 @@ def test_standard_library():
         "typing",
     ]
     
+    # Import everything in one fresh interpreter instead of one per module
+    code = (
+        "import importlib\n"
+        f"for m in {modules_to_test!r}:\n"
+        "    try:\n"
+        "        importlib.import_module(m)\n"
+        "        print(f'OK:{m}')\n"
+        "    except Exception as e:\n"
+        "        # Keep the reason on one line so the output stays parseable\n"
+        "        reason = ' '.join(str(e).split())\n"
+        "        print(f'FAIL:{m}:{reason}')\n"
+    )
+    returncode, stdout, stderr = await run_command(sys.executable, "-c", code)
+    if returncode != 0:
+        print_error(f"Standard library check failed: {stderr}")
+        return False
+    
     all_passed = True
-    for module in modules_to_test:
-        try:
-            __import__(module)
+    for line in stdout.splitlines():
+        status, module, *detail = line.split(":", 2)
+        if status == "OK":
             print_success(f"import {module}")
-        except ImportError as e:
-            print_error(f"import {module}: {e}")
+        else:
+            print_error(f"import {module}: {detail[0] if detail else ''}")
             all_passed = False
     
     return all_passed
 
 
+# Tests in the order their output and results are reported
+TESTS = {
+    "Python Info": test_python_info,
+    "Standard Library": test_standard_library,
+    "pip": test_pip,
+    "Package Installation": test_package_installation,
+    "Virtual Environment": test_venv,
+}
+
+
+async def run_test(test_name):
+    """Run a single test, buffering its output so concurrent runs don't interleave."""
+    output = []
+    _output.set(output)
+    try:
+        result = await TESTS[test_name]()
+    except Exception as e:
+        print_error(f"{test_name} test crashed: {e}")
+        result = False
+    return result, output
+
+
+async def run_all():
+    """Run all tests concurrently, returning (result, output) per test in order."""
+    return await asyncio.gather(*(run_test(name) for name in TESTS))
+
+
 def main():
     """Run all tests."""
     print()
@@ -213,14 +265,15 @@ def main():
     print("║           Python-NoAdmin Installation Tester             ║")
     print("╚══════════════════════════════════════════════════════════╝")
     
-    results = {}
+    # Run tests concurrently; they use separate temp dirs and don't interfere
+    outcomes = asyncio.run(run_all())
     
-    # Run tests
-    results["Python Info"] = test_python_info()
-    results["Standard Library"] = test_standard_library()
-    results["pip"] = test_pip()
-    results["Package Installation"] = test_package_installation()
-    results["Virtual Environment"] = test_venv()
+    # Report in a stable order
+    results = {}
+    for test_name, (result, output) in zip(TESTS, outcomes):
+        results[test_name] = result
+        for line in output:
+            print(line)
     
     # Summary
     print_header("Test Summary")
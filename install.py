@@ -14,19 +14,20 @@ Usage:
 """
 
 import argparse
+import contextlib
+import io
 import json
 import os
-import platform
+import re
 import shutil
 import stat
 import subprocess
 import sys
-import tarfile
-import tempfile
-import urllib.request
-import zipfile
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import BinaryIO, Callable, Optional, Tuple
 
 # ============================================================================
 # Configuration
@@ -35,6 +36,9 @@ from typing import Optional, Tuple
 DEFAULT_VERSION = "3.12.8"
 INSTALL_DIR_NAME = ".python-nonadmin"
 
+# Records the SHA-256 of the archive an installation was extracted from
+INSTALL_MARKER = ".installed_sha256"
+
 # python-build-standalone release info
 PBS_RELEASE_TAG = "20241206"
 PBS_BASE_URL = "https://github.com/indygreg/python-build-standalone/releases/download"
@@ -43,6 +47,19 @@ PBS_BASE_URL = "https://github.com/indygreg/python-build-standalone/releases/dow
 PYTHON_ORG_BASE = "https://www.python.org/ftp/python"
 GET_PIP_URL = "https://bootstrap.pypa.io/get-pip.py"
 
+# Cached get-pip.py is reused for this many seconds (7 days)
+GET_PIP_MAX_AGE = 7 * 24 * 60 * 60
+
+# Buffer size for copying downloads (1 MiB)
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Files at least this large are fetched as concurrent byte ranges when the
+# server supports it, to overlap per-connection latency
+SEGMENTED_DOWNLOAD_MIN_SIZE = 4 * 1024 * 1024
+DOWNLOAD_SEGMENTS = 4
+
+USER_AGENT = "Python-NoAdmin-Installer/1.0"
+
 # Available versions (can be extended)
 AVAILABLE_VERSIONS = [
     "3.12.8",
@@ -52,6 +69,10 @@ AVAILABLE_VERSIONS = [
     "3.10.14",
     "3.10.13",
 ]
+_AVAILABLE_VERSIONS_SET = frozenset(AVAILABLE_VERSIONS)
+
+# Accepted shape of --version (e.g. 3.12.8)
+_VERSION_RE = re.compile(r"3\.\d{1,2}\.\d{1,2}")
 
 # ============================================================================
 # Terminal Colors
@@ -86,20 +107,27 @@ elif sys.platform == "win32":
         Colors.disable()
 
 
+# Log prefixes, built once now that color support is known
+_INFO = f"{Colors.CYAN}[INFO]{Colors.NC} "
+_SUCCESS = f"{Colors.GREEN}[SUCCESS]{Colors.NC} "
+_WARNING = f"{Colors.YELLOW}[WARNING]{Colors.NC} "
+_ERROR = f"{Colors.RED}[ERROR]{Colors.NC} "
+
+
 def info(msg: str) -> None:
-    print(f"{Colors.CYAN}[INFO]{Colors.NC} {msg}")
+    print(_INFO + msg)
 
 
 def success(msg: str) -> None:
-    print(f"{Colors.GREEN}[SUCCESS]{Colors.NC} {msg}")
+    print(_SUCCESS + msg)
 
 
 def warn(msg: str) -> None:
-    print(f"{Colors.YELLOW}[WARNING]{Colors.NC} {msg}")
+    print(_WARNING + msg)
 
 
 def error(msg: str) -> None:
-    print(f"{Colors.RED}[ERROR]{Colors.NC} {msg}")
+    print(_ERROR + msg)
 
 
 def header(msg: str) -> None:
@@ -114,6 +142,7 @@ def header(msg: str) -> None:
 # Platform Detection
 # ============================================================================
 
+@lru_cache(maxsize=1)
 def get_platform_info() -> Tuple[str, str]:
     """
     Detect OS and architecture.
@@ -122,6 +151,8 @@ def get_platform_info() -> Tuple[str, str]:
         Tuple of (os_name, arch) where os_name is 'windows', 'macos', or 'linux'
         and arch is 'x86_64' or 'aarch64'.
     """
+    import platform
+    
     system = platform.system().lower()
     machine = platform.machine().lower()
     
@@ -148,18 +179,33 @@ def get_platform_info() -> Tuple[str, str]:
     return os_name, arch
 
 
+@lru_cache(maxsize=1)
 def get_install_dir() -> Path:
     """Get the installation directory path."""
     home = Path.home()
     return home / INSTALL_DIR_NAME
 
 
+@lru_cache(maxsize=1)
+def get_cache_dir() -> Path:
+    """
+    Get the download cache directory path.
+    
+    Kept outside the installation directory so it survives reinstalls.
+    """
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        return Path(os.environ["LOCALAPPDATA"]) / "python-nonadmin"
+    
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "python-nonadmin"
+
+
 # ============================================================================
 # Download URLs
 # ============================================================================
 
-def get_pbs_download_url(version: str, os_name: str, arch: str) -> str:
-    """Get python-build-standalone download URL for Unix systems."""
+def get_pbs_filename(version: str, os_name: str, arch: str) -> str:
+    """Get python-build-standalone archive name for Unix systems."""
     if os_name == "macos":
         target = f"{arch}-apple-darwin"
     elif os_name == "linux":
@@ -167,10 +213,49 @@ def get_pbs_download_url(version: str, os_name: str, arch: str) -> str:
     else:
         raise ValueError(f"PBS not available for {os_name}")
     
-    filename = f"cpython-{version}+{PBS_RELEASE_TAG}-{target}-install_only.tar.gz"
+    return f"cpython-{version}+{PBS_RELEASE_TAG}-{target}-install_only.tar.gz"
+
+
+def get_pbs_download_url(version: str, os_name: str, arch: str) -> str:
+    """Get python-build-standalone download URL for Unix systems."""
+    filename = get_pbs_filename(version, os_name, arch)
     return f"{PBS_BASE_URL}/{PBS_RELEASE_TAG}/{filename}"
 
 
+def get_pbs_checksum(version: str, os_name: str, arch: str) -> Optional[str]:
+    """
+    Look up the published SHA-256 of a python-build-standalone archive.
+    
+    Returns:
+        The hex digest from the release's SHA256SUMS manifest, or None if
+        the manifest could not be fetched or does not list the archive.
+    """
+    import http.client
+    import urllib.request
+    
+    filename = get_pbs_filename(version, os_name, arch)
+    request = urllib.request.Request(
+        f"{PBS_BASE_URL}/{PBS_RELEASE_TAG}/SHA256SUMS",
+        headers={"User-Agent": USER_AGENT}
+    )
+    
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            manifest = response.read().decode("utf-8", errors="replace")
+    except (urllib.error.URLError, OSError, http.client.HTTPException) as e:
+        # Includes read timeouts and truncated responses, which aren't URLErrors
+        warn(f"Could not fetch checksums ({getattr(e, 'reason', e)}); skipping verification")
+        return None
+    
+    for line in manifest.splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[1].lstrip("*") == filename:
+            return parts[0].lower()
+    
+    warn(f"No published checksum for {filename}; skipping verification")
+    return None
+
+
 def get_windows_embed_url(version: str, arch: str) -> str:
     """Get Windows embeddable package URL."""
     if arch == "x86_64":
@@ -189,8 +274,141 @@ def get_windows_embed_url(version: str, arch: str) -> str:
 # Download and Extraction
 # ============================================================================
 
+class _ProgressReader:
+    """File-like wrapper that reports download progress as data is read."""
+    
+    # Redraw when progress crosses a 0.5% step or this many seconds pass
+    UPDATE_INTERVAL = 0.05
+    UPDATE_STEPS = 200
+    
+    def __init__(self, response, total_size: int):
+        import hashlib
+        
+        self._response = response
+        self._total_size = total_size
+        self._downloaded = 0
+        self._last_update = 0.0
+        self._last_step = -1
+        self._lock = threading.Lock()
+        self.sha256 = hashlib.sha256()
+    
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._response.read(size)
+        self.sha256.update(chunk)
+        self.advance(len(chunk))
+        return chunk
+    
+    def advance(self, nbytes: int) -> None:
+        """Record downloaded bytes; safe to call from several threads."""
+        with self._lock:
+            self._downloaded += nbytes
+            if self._total_size <= 0:
+                return
+            
+            step = self._downloaded * self.UPDATE_STEPS // self._total_size
+            now = time.monotonic()
+            if step != self._last_step or now - self._last_update >= self.UPDATE_INTERVAL:
+                self._last_step = step
+                self._last_update = now
+                self._report()
+    
+    def _report(self) -> None:
+        if self._total_size > 0:
+            percent = (self._downloaded / self._total_size) * 100
+            mb_downloaded = self._downloaded / (1024 * 1024)
+            mb_total = self._total_size / (1024 * 1024)
+            line = f"\r  Progress: {percent:.1f}% ({mb_downloaded:.1f}/{mb_total:.1f} MB)"
+            try:
+                # Write straight to the fd, bypassing the text layer; flush
+                # first so earlier log lines can't land after the progress
+                sys.stdout.flush()
+                os.write(sys.stdout.fileno(), line.encode())
+            except (AttributeError, OSError, ValueError):
+                print(line, end="", flush=True)
+    
+    def finish(self) -> None:
+        """Show the final progress and end the progress line."""
+        self._report()
+        print()
+
+
+class _RangeDownloadError(RuntimeError):
+    """A ranged download could not be completed; retry as a single stream."""
+
+
+def _probe_ranged_download(url: str) -> Tuple[str, int]:
+    """
+    Check whether a URL can be downloaded as concurrent byte ranges.
+    
+    Returns:
+        Tuple of (final_url, size) after following redirects, where size is
+        0 if the server does not advertise range support or a known length.
+    """
+    import http.client
+    import urllib.request
+    
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT}, method="HEAD")
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            if response.headers.get("Accept-Ranges", "").lower() != "bytes":
+                return url, 0
+            return response.geturl(), int(response.headers.get("Content-Length", 0))
+    except (urllib.error.URLError, OSError, http.client.HTTPException, ValueError):
+        # Not fatal: fall back to a single streamed download
+        return url, 0
+
+
+def _download_segments(url: str, total_size: int, write_at: Callable[[int, bytes], None],
+                       progress: _ProgressReader) -> None:
+    """Download ``total_size`` bytes as concurrent ranges, passing each block to ``write_at``."""
+    import urllib.request
+    from concurrent.futures import ThreadPoolExecutor
+    
+    segment_size = -(-total_size // DOWNLOAD_SEGMENTS)
+    
+    def fetch(start: int) -> None:
+        end = min(start + segment_size, total_size) - 1
+        request = urllib.request.Request(
+            url,
+            headers={"User-Agent": USER_AGENT, "Range": f"bytes={start}-{end}"}
+        )
+        with urllib.request.urlopen(request, timeout=60) as response:
+            if response.status != 206:
+                raise _RangeDownloadError(f"server ignored range request (HTTP {response.status})")
+            offset = start
+            while True:
+                chunk = response.read(COPY_BUFFER_SIZE)
+                if not chunk:
+                    break
+                write_at(offset, chunk)
+                offset += len(chunk)
+                progress.advance(len(chunk))
+        if offset != end + 1:
+            raise _RangeDownloadError("a segment ended early")
+    
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_SEGMENTS) as pool:
+        futures = [pool.submit(fetch, start) for start in range(0, total_size, segment_size)]
+        for future in futures:
+            future.result()
+
+
+def _preallocate(f: BinaryIO, size: int) -> None:
+    """Reserve ``size`` bytes for a file up front to avoid fragmentation."""
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError:
+            # Not supported by this filesystem
+            pass
+    # Sets the end of file (SetEndOfFile on Windows)
+    f.truncate(size)
+
+
 def download_file(url: str, dest: Path, description: str = "file") -> None:
     """Download a file with progress indication."""
+    import urllib.request
+    
     info(f"Downloading {description}...")
     info(f"URL: {url}")
     
@@ -198,31 +416,29 @@ def download_file(url: str, dest: Path, description: str = "file") -> None:
         # Create a request with a user agent
         request = urllib.request.Request(
             url,
-            headers={"User-Agent": "Python-NoAdmin-Installer/1.0"}
+            headers={"User-Agent": USER_AGENT}
         )
         
         with urllib.request.urlopen(request, timeout=60) as response:
             total_size = int(response.headers.get("Content-Length", 0))
-            downloaded = 0
-            block_size = 8192
+            reader = _ProgressReader(response, total_size)
             
             with open(dest, "wb") as f:
-                while True:
-                    chunk = response.read(block_size)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    
-                    if total_size > 0:
-                        percent = (downloaded / total_size) * 100
-                        mb_downloaded = downloaded / (1024 * 1024)
-                        mb_total = total_size / (1024 * 1024)
-                        print(f"\r  Progress: {percent:.1f}% ({mb_downloaded:.1f}/{mb_total:.1f} MB)", end="", flush=True)
+                if total_size > 0:
+                    _preallocate(f, total_size)
+                shutil.copyfileobj(reader, f, COPY_BUFFER_SIZE)
+                received = f.tell()
+            
+            if total_size > 0 and received != total_size:
+                print()  # End the partial progress line
+                raise RuntimeError(
+                    f"Download incomplete: got {received} of {total_size} bytes. "
+                    "Check your internet connection."
+                )
             
-            print()  # Newline after progress
+            reader.finish()
         
-        success(f"Downloaded: {dest.name}")
+        success(f"Downloaded: {description}")
         
     except urllib.error.HTTPError as e:
         raise RuntimeError(f"HTTP Error {e.code}: {e.reason}. URL may be invalid for this version.")
@@ -230,30 +446,290 @@ def download_file(url: str, dest: Path, description: str = "file") -> None:
         raise RuntimeError(f"Network error: {e.reason}. Check your internet connection.")
 
 
-def extract_archive(archive: Path, dest: Path, strip_components: int = 0) -> None:
-    """Extract a tar.gz or zip archive."""
-    info(f"Extracting to: {dest}")
+def _fast_rmtree(path: Path) -> None:
+    """
+    Remove a directory tree, using ``rm -rf`` where available.
     
-    dest.mkdir(parents=True, exist_ok=True)
+    A CPython installation has thousands of files; ``rm`` removes them
+    noticeably faster than shutil.rmtree's per-entry Python calls.
+    """
+    if sys.platform != "win32" and shutil.which("rm"):
+        subprocess.run(["rm", "-rf", "--", str(path)], check=False, capture_output=True)
+        if not path.exists():
+            return
+    shutil.rmtree(path)
+
+
+def _extract_workers() -> int:
+    """Number of threads used to write extracted files."""
+    return min(32, (os.cpu_count() or 1) * 2)
+
+
+def _write_member(target: Path, data: bytes, mode: int, mtime: float) -> None:
+    """Write one extracted file and restore its permissions and mtime."""
+    with open(target, "wb") as f:
+        f.write(data)
+    os.chmod(target, mode)
+    os.utime(target, (mtime, mtime))
+
+
+def _extract_zip_member(zf, member, dest: Path) -> None:
+    """Extract one zip member, tolerating a parent directory created concurrently."""
+    try:
+        zf.extract(member, dest)
+    except FileExistsError:
+        # Another worker created a shared parent between the exists check and makedirs
+        zf.extract(member, dest)
+
+
+def _extract_zip(source: BinaryIO, dest: Path) -> None:
+    """Extract a zip archive, writing members concurrently."""
+    import zipfile
+    from concurrent.futures import ThreadPoolExecutor
+    
+    # ZipFile.extract sanitizes member names, so entries can't escape dest
+    with zipfile.ZipFile(source, "r") as zf:
+        with ThreadPoolExecutor(max_workers=_extract_workers()) as pool:
+            futures = [
+                pool.submit(_extract_zip_member, zf, member, dest)
+                for member in zf.infolist()
+            ]
+            for future in futures:
+                future.result()
+
+
+def _extract_tar(source: BinaryIO, dest: Path, strip_components: int) -> None:
+    """
+    Extract a gzipped tar stream, writing regular files concurrently.
+    
+    Decompression is inherently sequential, so members are read in order
+    on the calling thread and only the file writes are handed to workers.
+    """
+    import tarfile
+    from concurrent.futures import ThreadPoolExecutor
+    
+    max_pending = _extract_workers() * 4
+    pending = []
+    dest_root = os.path.join(os.path.realpath(dest), "")
     
-    if archive.suffix == ".zip" or archive.name.endswith(".zip"):
-        with zipfile.ZipFile(archive, "r") as zf:
-            zf.extractall(dest)
-    elif archive.name.endswith(".tar.gz") or archive.name.endswith(".tgz"):
-        with tarfile.open(archive, "r:gz") as tf:
+    # Safe-extraction filter for links and directories (Python 3.12+, and
+    # backported to security releases of 3.8-3.11)
+    extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+    
+    def drain(limit: int) -> None:
+        while len(pending) > limit:
+            pending.pop(0).result()
+    
+    with tarfile.open(fileobj=source, mode="r|gz") as tf, \
+            ThreadPoolExecutor(max_workers=_extract_workers()) as pool:
+        for member in tf:
+            # TarFile keeps every member it has read; drop them so memory
+            # use stays flat however large the archive is
+            tf.members.clear()
+            
             if strip_components > 0:
                 # Strip leading path components
-                for member in tf.getmembers():
-                    parts = member.name.split("/")
-                    if len(parts) > strip_components:
-                        member.name = "/".join(parts[strip_components:])
-                        tf.extract(member, dest)
+                parts = member.name.split("/", strip_components)
+                if len(parts) <= strip_components:
+                    continue
+                member.name = parts[-1]
+                if member.islnk():
+                    # Hard link targets are archive paths and need the same rewrite
+                    member.linkname = member.linkname.split("/", strip_components)[-1]
+            
+            if member.isfile():
+                target = dest / member.name
+                # Files are written directly rather than via TarFile.extract,
+                # so reject names that would land outside dest, including
+                # through symlinks extracted earlier
+                if not os.path.realpath(target).startswith(dest_root):
+                    raise RuntimeError(f"Archive member escapes install directory: {member.name}")
+                target.parent.mkdir(parents=True, exist_ok=True)
+                data = tf.extractfile(member).read()
+                pending.append(pool.submit(_write_member, target, data, member.mode, member.mtime))
+                drain(max_pending)
             else:
-                tf.extractall(dest)
+                # Links must not change the paths that pending writes resolve
+                # through, and hard links need their target written first
+                if member.islnk() or member.issym():
+                    drain(0)
+                tf.extract(member, dest, **extract_kwargs)
+        
+        drain(0)
+
+
+def extract_archive(source: BinaryIO, dest: Path, archive_format: str, strip_components: int = 0) -> None:
+    """
+    Extract a tar.gz or zip archive from a binary file object.
+    
+    tar.gz archives are read sequentially, so ``source`` may be a
+    non-seekable stream such as an HTTP response. zip archives need
+    random access and must be given a seekable file object.
+    """
+    dest.mkdir(parents=True, exist_ok=True)
+    
+    if archive_format == "zip":
+        _extract_zip(source, dest)
+    elif archive_format == "tar.gz":
+        _extract_tar(source, dest, strip_components)
     else:
-        raise ValueError(f"Unknown archive format: {archive.name}")
+        raise ValueError(f"Unknown archive format: {archive_format}")
+
+
+def _download_to_memory(url: str) -> Tuple[BinaryIO, str]:
+    """
+    Download a file into memory with progress indication.
+    
+    Returns:
+        Tuple of (buffer, sha256) where buffer is positioned at the start
+        and sha256 is the hex digest of its contents.
+    """
+    import hashlib
+    import urllib.request
+    
+    ranged_url, ranged_size = _probe_ranged_download(url)
+    
+    if ranged_size >= SEGMENTED_DOWNLOAD_MIN_SIZE:
+        progress = _ProgressReader(None, ranged_size)
+        
+        # Size the buffer up front and fill it in place, without an extra copy
+        buffer = io.BytesIO()
+        buffer.seek(ranged_size - 1)
+        buffer.write(b"\0")
+        view = buffer.getbuffer()
+        
+        def write_at(offset: int, data: bytes) -> None:
+            view[offset:offset + len(data)] = data
+        
+        try:
+            _download_segments(ranged_url, ranged_size, write_at, progress)
+            progress.finish()
+            sha256 = hashlib.sha256(view).hexdigest()
+            view.release()
+            buffer.seek(0)
+            return buffer, sha256
+        except _RangeDownloadError as e:
+            view.release()
+            print()  # End the partial progress line
+            warn(f"Ranged download failed ({e}); retrying as a single stream")
+    
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
     
-    success("Extraction complete")
+    with urllib.request.urlopen(request, timeout=60) as response:
+        reader = _ProgressReader(response, int(response.headers.get("Content-Length", 0)))
+        buffer = io.BytesIO()
+        shutil.copyfileobj(reader, buffer, COPY_BUFFER_SIZE)
+        reader.finish()
+        buffer.seek(0)
+        return buffer, reader.sha256.hexdigest()
+
+
+def _verify_sha256(actual: str, expected: Optional[str]) -> None:
+    """Raise if a downloaded archive does not match its published checksum."""
+    if expected is None:
+        return
+    if actual != expected:
+        raise RuntimeError(f"Checksum mismatch: expected {expected}, got {actual}")
+    success("Checksum verified")
+
+
+def download_and_extract(url: str, dest: Path, archive_format: str, description: str = "archive",
+                         strip_components: int = 0, expected_sha256: Optional[str] = None,
+                         python_exe: Optional[Path] = None) -> None:
+    """
+    Download an archive and extract it without writing it to disk first.
+    
+    tar.gz archives are extracted straight from the HTTP response; zip
+    archives are buffered in memory since they require random access.
+    Streamed archives are extracted into a sibling staging directory, so
+    any existing installation at ``dest`` is only replaced once the whole
+    archive has been extracted (and verified, if a checksum is given).
+    
+    The archive's SHA-256 is recorded in ``dest``. When reinstalling over
+    an installation with a recorded hash, the archive is buffered in memory
+    and extraction is skipped if the hash is unchanged.
+    
+    If ``expected_sha256`` is given the archive is verified against it, and
+    the download is skipped entirely when the recorded hash already matches.
+    
+    The recorded hash is ignored if ``python_exe`` is given and missing, so
+    a damaged installation is always reinstalled.
+    """
+    import urllib.request
+    
+    marker = dest / INSTALL_MARKER
+    previous_sha256 = marker.read_text().strip() if marker.exists() else None
+    if previous_sha256 and python_exe is not None and not python_exe.exists():
+        warn(f"Existing installation is missing {python_exe.name}, reinstalling")
+        previous_sha256 = None
+    
+    if expected_sha256 and previous_sha256 == expected_sha256:
+        info(f"{description} is already installed from a verified archive, skipping download")
+        info("For a clean reinstall, run with --uninstall first")
+        return
+    
+    info(f"Downloading {description}...")
+    info(f"URL: {url}")
+    
+    try:
+        with contextlib.ExitStack() as stack:
+            reader = None
+            if archive_format == "zip" or previous_sha256:
+                source, sha256 = _download_to_memory(url)
+                _verify_sha256(sha256, expected_sha256)
+                if sha256 == previous_sha256:
+                    success(f"Downloaded: {description}")
+                    info("Archive unchanged since last install, skipping extraction")
+                    info("For a clean reinstall, run with --uninstall first")
+                    return
+            else:
+                request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+                response = stack.enter_context(urllib.request.urlopen(request, timeout=60))
+                reader = source = _ProgressReader(response, int(response.headers.get("Content-Length", 0)))
+            
+            if reader is None:
+                # Buffered archives are already verified; replace in place
+                if dest.exists():
+                    warn("Removing existing installation...")
+                    _fast_rmtree(dest)
+                extract_dir = dest
+            else:
+                # Streamed archives can only be verified after extraction, so
+                # keep the existing installation until the check passes
+                extract_dir = dest.with_name(dest.name + ".partial")
+                if extract_dir.exists():
+                    _fast_rmtree(extract_dir)
+            
+            info(f"Extracting to: {dest}")
+            try:
+                extract_archive(source, extract_dir, archive_format, strip_components)
+                if reader is not None:
+                    # Consume any trailing padding so the hash covers the whole archive
+                    while reader.read(COPY_BUFFER_SIZE):
+                        pass
+                    reader.finish()
+                    sha256 = reader.sha256.hexdigest()
+                    _verify_sha256(sha256, expected_sha256)
+            except BaseException:
+                # Don't leave a partial or unverified extraction behind
+                if extract_dir != dest and extract_dir.exists():
+                    _fast_rmtree(extract_dir)
+                raise
+            
+            if extract_dir != dest:
+                if dest.exists():
+                    warn("Removing existing installation...")
+                    _fast_rmtree(dest)
+                os.replace(extract_dir, dest)
+        
+        marker.write_text(sha256)
+        success(f"Downloaded: {description}")
+        success("Extraction complete")
+        
+    except urllib.error.HTTPError as e:
+        raise RuntimeError(f"HTTP Error {e.code}: {e.reason}. URL may be invalid for this version.")
+    except urllib.error.URLError as e:
+        raise RuntimeError(f"Network error: {e.reason}. Check your internet connection.")
 
 
 # ============================================================================
@@ -266,18 +742,9 @@ def install_windows(version: str, install_dir: Path, arch: str) -> Path:
     # Download embeddable package
     url = get_windows_embed_url(version, arch)
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        zip_file = temp_path / "python-embed.zip"
-        
-        download_file(url, zip_file, f"Python {version} embeddable package")
-        
-        # Extract
-        if install_dir.exists():
-            warn("Removing existing installation...")
-            shutil.rmtree(install_dir)
-        
-        extract_archive(zip_file, install_dir)
+    python_exe = install_dir / "python.exe"
+    download_and_extract(url, install_dir, "zip", f"Python {version} embeddable package",
+                         python_exe=python_exe)
     
     # Configure ._pth file to enable site-packages
     major_minor = "".join(version.split(".")[:2])
@@ -285,19 +752,18 @@ def install_windows(version: str, install_dir: Path, arch: str) -> Path:
     
     if pth_file.exists():
         info(f"Configuring {pth_file.name} for pip support...")
-        content = pth_file.read_text()
+        # The edit is ASCII-only, so work on bytes and skip decoding
+        content = pth_file.read_bytes()
         
         # Uncomment "import site"
-        if "#import site" in content:
-            content = content.replace("#import site", "import site")
-            pth_file.write_text(content)
+        if b"#import site" in content:
+            pth_file.write_bytes(content.replace(b"#import site", b"import site"))
             success("Enabled 'import site'")
-        elif "import site" not in content:
-            with open(pth_file, "a") as f:
-                f.write("\nimport site\n")
+        elif b"import site" not in content:
+            with open(pth_file, "ab") as f:
+                f.write(b"\nimport site\n")
             success("Added 'import site'")
     
-    python_exe = install_dir / "python.exe"
     return python_exe
 
 
@@ -309,19 +775,13 @@ def install_unix(version: str, install_dir: Path, os_name: str, arch: str) -> Pa
     """Install Python on macOS/Linux using python-build-standalone."""
     
     url = get_pbs_download_url(version, os_name, arch)
+    expected_sha256 = get_pbs_checksum(version, os_name, arch)
+    bin_dir = install_dir / "bin"
+    python_exe = bin_dir / "python3"
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        tarball = temp_path / "python.tar.gz"
-        
-        download_file(url, tarball, f"Python {version}")
-        
-        # Extract (strip 'python/' prefix from python-build-standalone)
-        if install_dir.exists():
-            warn("Removing existing installation...")
-            shutil.rmtree(install_dir)
-        
-        extract_archive(tarball, install_dir, strip_components=1)
+    # Extract while downloading (strip 'python/' prefix from python-build-standalone)
+    download_and_extract(url, install_dir, "tar.gz", f"Python {version}", strip_components=1,
+                         expected_sha256=expected_sha256, python_exe=python_exe)
     
     # Handle macOS quarantine
     if os_name == "macos":
@@ -337,13 +797,16 @@ def install_unix(version: str, install_dir: Path, os_name: str, arch: str) -> Pa
             pass
     
     # Make binaries executable
-    bin_dir = install_dir / "bin"
     if bin_dir.exists():
-        for exe in bin_dir.iterdir():
-            if exe.is_file():
-                exe.chmod(exe.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        exec_bits = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+        with os.scandir(bin_dir) as entries:
+            for entry in entries:
+                # Symlinks (e.g. python3 -> python3.12) share their target's mode
+                if entry.is_file(follow_symlinks=False):
+                    mode = entry.stat(follow_symlinks=False).st_mode
+                    if mode & exec_bits != exec_bits:
+                        os.chmod(entry.path, mode | exec_bits)
     
-    python_exe = bin_dir / "python3"
     return python_exe
 
 
@@ -351,44 +814,67 @@ def install_unix(version: str, install_dir: Path, os_name: str, arch: str) -> Pa
 # pip Installation
 # ============================================================================
 
+def get_cached_get_pip() -> Path:
+    """Return a local get-pip.py, downloading it only if the cached copy is missing or stale."""
+    cache_dir = get_cache_dir()
+    get_pip_path = cache_dir / "get-pip.py"
+    
+    if get_pip_path.exists() and time.time() - get_pip_path.stat().st_mtime < GET_PIP_MAX_AGE:
+        info(f"Using cached get-pip.py: {get_pip_path}")
+        return get_pip_path
+    
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Download beside the cache entry and swap it in, so an interrupted
+    # download never leaves a truncated get-pip.py behind
+    partial_path = cache_dir / "get-pip.py.part"
+    download_file(GET_PIP_URL, partial_path, "get-pip.py")
+    os.replace(partial_path, get_pip_path)
+    return get_pip_path
+
+
 def install_pip(python_exe: Path, install_dir: Path) -> None:
     """Install or upgrade pip."""
     
     info("Checking pip installation...")
     
-    # Check if pip already works
+    # Upgrade pip if it is already present; this doubles as the presence check
+    # and saves starting a second interpreter just for "pip --version"
     result = subprocess.run(
-        [str(python_exe), "-m", "pip", "--version"],
+        [str(python_exe), "-m", "pip", "install", "--upgrade", "pip", "--quiet"],
         capture_output=True,
         text=True
     )
     
     if result.returncode == 0:
-        success(f"pip already installed: {result.stdout.strip()}")
-        # Upgrade pip
-        info("Upgrading pip to latest version...")
-        subprocess.run(
-            [str(python_exe), "-m", "pip", "install", "--upgrade", "pip", "--quiet"],
-            check=False
-        )
+        success("pip is up to date")
+        return
+    
+    # Missing or broken pip (e.g. "No module named 'pip._internal'") gets
+    # reinstalled; anything else, such as a network error, is only reported
+    pip_broken = "No module named" in result.stderr or (
+        "Traceback" in result.stderr and "pip" in result.stderr
+    )
+    if not pip_broken:
+        warn(f"Could not upgrade pip: {result.stderr.strip()}")
         return
     
     # Download and run get-pip.py
     info("Installing pip...")
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        get_pip_path = Path(temp_dir) / "get-pip.py"
-        download_file(GET_PIP_URL, get_pip_path, "get-pip.py")
-        
-        result = subprocess.run(
-            [str(python_exe), str(get_pip_path), "--no-warn-script-location"],
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode != 0:
-            error(f"pip installation failed: {result.stderr}")
-            raise RuntimeError("Failed to install pip")
+    get_pip_path = get_cached_get_pip()
+    
+    result = subprocess.run(
+        [str(python_exe), str(get_pip_path), "--no-warn-script-location"],
+        capture_output=True,
+        text=True
+    )
+    
+    if result.returncode != 0:
+        # Don't keep reusing a cached get-pip.py that may be broken
+        get_pip_path.unlink(missing_ok=True)
+        error(f"pip installation failed: {result.stderr}")
+        raise RuntimeError("Failed to install pip")
     
     # Verify
     result = subprocess.run(
@@ -407,6 +893,22 @@ def install_pip(python_exe: Path, install_dir: Path) -> None:
 # PATH Configuration
 # ============================================================================
 
+def _broadcast_environment_change() -> None:
+    """Notify running applications (e.g. Explorer) that the user environment changed."""
+    import ctypes
+    from ctypes import wintypes
+    
+    HWND_BROADCAST = 0xFFFF
+    WM_SETTINGCHANGE = 0x001A
+    SMTO_ABORTIFHUNG = 0x0002
+    
+    result = wintypes.DWORD()
+    ctypes.windll.user32.SendMessageTimeoutW(
+        HWND_BROADCAST, WM_SETTINGCHANGE, 0, "Environment",
+        SMTO_ABORTIFHUNG, 5000, ctypes.byref(result)
+    )
+
+
 def configure_path_windows(install_dir: Path) -> None:
     """Add Python to user PATH on Windows."""
     import winreg
@@ -429,22 +931,27 @@ def configure_path_windows(install_dir: Path) -> None:
             except FileNotFoundError:
                 current_path = ""
             
-            # Add paths if not present
+            # Add paths if not present (Windows paths are case-insensitive)
             path_parts = current_path.split(";") if current_path else []
-            modified = False
-            
-            for path_to_add in paths_to_add:
-                if path_to_add not in path_parts:
-                    path_parts.insert(0, path_to_add)
-                    modified = True
+            existing = {p.casefold() for p in path_parts}
+            to_insert = [p for p in paths_to_add if p.casefold() not in existing]
+            modified = bool(to_insert)
             
             if modified:
+                path_parts = to_insert + path_parts
                 new_path = ";".join(path_parts)
                 winreg.SetValueEx(key, "PATH", 0, winreg.REG_EXPAND_SZ, new_path)
                 success("Added to user PATH")
-                warn("Restart your terminal for PATH changes to take effect")
             else:
                 info("Already in user PATH")
+        
+        if modified:
+            # Let new terminals pick up PATH without signing out
+            try:
+                _broadcast_environment_change()
+            except Exception:
+                pass
+            warn("Open a new terminal for PATH changes to take effect")
                 
     except Exception as e:
         warn(f"Could not update PATH automatically: {e}")
@@ -600,26 +1107,30 @@ def uninstall() -> None:
     """Uninstall Python-NoAdmin."""
     
     install_dir = get_install_dir()
+    cache_dir = get_cache_dir()
     os_name, _ = get_platform_info()
     
     header("Python-NoAdmin Uninstaller")
     
-    if not install_dir.exists():
+    targets = [d for d in (install_dir, cache_dir) if d.exists()]
+    if not targets:
         info(f"Nothing to uninstall. Directory not found: {install_dir}")
         return
     
     # Confirm
-    print(f"This will remove: {install_dir}")
+    for target in targets:
+        print(f"This will remove: {target}")
     response = input("Continue? [y/N] ").strip().lower()
     
     if response not in ("y", "yes"):
         info("Uninstallation cancelled")
         return
     
-    # Remove installation
+    # Remove installation and download cache
     info("Removing installation...")
-    shutil.rmtree(install_dir)
-    success(f"Removed: {install_dir}")
+    for target in targets:
+        _fast_rmtree(target)
+        success(f"Removed: {target}")
     
     # Note about PATH
     if os_name == "windows":
@@ -687,6 +1198,13 @@ Examples:
     
     args = parser.parse_args()
     
+    # Reject malformed versions before any network I/O
+    if not args.list_versions and not args.uninstall:
+        if not _VERSION_RE.fullmatch(args.version):
+            parser.error(f"invalid version '{args.version}' (expected e.g. {DEFAULT_VERSION})")
+        if args.version not in _AVAILABLE_VERSIONS_SET:
+            warn(f"Python {args.version} is not in the tested version list; it may not be available")
+    
     if args.list_versions:
         list_versions()
     elif args.uninstall:
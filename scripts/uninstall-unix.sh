@@ -19,6 +19,7 @@ warn() { echo -e "${YELLOW}[WARNING]${NC} $1"; }
 error() { echo -e "${RED}[ERROR]${NC} $1"; }
 
 INSTALL_DIR="${HOME}/.python-nonadmin"
+CACHE_DIR="${XDG_CACHE_HOME:-${HOME}/.cache}/python-nonadmin"
 
 echo ""
 echo -e "${CYAN}============================================${NC}"
@@ -43,6 +44,13 @@ else
     warn "Installation directory not found: $INSTALL_DIR"
 fi
 
+# Remove download cache (get-pip.py)
+if [ -d "$CACHE_DIR" ]; then
+    info "Removing download cache..."
+    rm -rf "$CACHE_DIR"
+    success "Removed: $CACHE_DIR"
+fi
+
 # Clean shell profiles
 clean_profile() {
     local profile="$1"
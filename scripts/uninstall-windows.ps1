@@ -3,8 +3,8 @@
     Uninstall Python-NoAdmin on Windows.
 
 .DESCRIPTION
-    Removes the Python-NoAdmin installation directory and cleans up
-    user PATH environment variable entries.
+    Removes the Python-NoAdmin installation directory and download cache,
+    and cleans up user PATH environment variable entries.
 #>
 
 param(
@@ -14,6 +14,7 @@ param(
 $ErrorActionPreference = "Stop"
 
 $InstallDir = "$env:USERPROFILE\.python-nonadmin"
+$CacheDir = "$env:LOCALAPPDATA\python-nonadmin"
 
 Write-Host ""
 Write-Host "============================================" -ForegroundColor Cyan
@@ -22,7 +23,7 @@ Write-Host "============================================" -ForegroundColor Cyan
 Write-Host ""
 
 # Check if installed
-if (-not (Test-Path $InstallDir)) {
+if (-not (Test-Path $InstallDir) -and -not (Test-Path $CacheDir)) {
     Write-Host "[WARNING] Installation not found at: $InstallDir" -ForegroundColor Yellow
     exit 0
 }
@@ -39,13 +40,26 @@ if (-not $Force) {
 # Remove installation directory
 Write-Host "[INFO] Removing installation directory..." -ForegroundColor Cyan
 try {
-    Remove-Item -Recurse -Force $InstallDir
-    Write-Host "[SUCCESS] Removed: $InstallDir" -ForegroundColor Green
+    if (Test-Path $InstallDir) {
+        Remove-Item -Recurse -Force $InstallDir
+        Write-Host "[SUCCESS] Removed: $InstallDir" -ForegroundColor Green
+    }
 } catch {
     Write-Host "[ERROR] Failed to remove installation: $_" -ForegroundColor Red
     exit 1
 }
 
+# Remove download cache (get-pip.py)
+if (Test-Path $CacheDir) {
+    Write-Host "[INFO] Removing download cache..." -ForegroundColor Cyan
+    try {
+        Remove-Item -Recurse -Force $CacheDir
+        Write-Host "[SUCCESS] Removed: $CacheDir" -ForegroundColor Green
+    } catch {
+        Write-Host "[WARNING] Failed to remove download cache: $_" -ForegroundColor Yellow
+    }
+}
+
 # Clean PATH
 Write-Host "[INFO] Cleaning user PATH..." -ForegroundColor Cyan
 $currentPath = [Environment]::GetEnvironmentVariable("PATH", "User")